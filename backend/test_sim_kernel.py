@@ -0,0 +1,99 @@
+"""
+Parity tests: the Numba kernel and the NumPy fallback implement the same queue model
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from backend_api import (
+    _FLOW_RATE,
+    _HOURLY_OUTPUTS,
+    _SEASONAL_FACTORS,
+    OperationalState,
+    ProcessSimulationEngine,
+    WorkQueue,
+    _SimState,
+    _forecast_records,
+)
+from sim_kernel import run_kernel
+
+def _random_state(rng: np.random.Generator, n_queues: int) -> OperationalState:
+    queues = [
+        WorkQueue(
+            id=f"q{i}",
+            name=f"Queue {i}",
+            workInProgress=int(rng.integers(0, 200)),
+            capacity=int(rng.choice([0, *rng.integers(1, 120, size=4)])),
+            avgProcessTime=float(rng.uniform(5, 90)),
+            employees=int(rng.integers(0, 12)),
+            complexity=float(rng.uniform(1.0, 3.0))
+        )
+        for i in range(n_queues)
+    ]
+    return OperationalState(
+        workQueues=queues,
+        incomingRate=float(rng.uniform(0, 300)),
+        timestamp=datetime(2025, 1, 1),
+        slaThreshold=int(rng.integers(15, 240))
+    )
+
+def _empty_outputs(n_hours: int, n_queues: int) -> dict:
+    arrays = {name: np.empty((n_hours, n_queues)) for name in _HOURLY_OUTPUTS}
+    arrays["total_risk"] = np.empty(n_hours)
+    return arrays
+
+@pytest.mark.parametrize("seed", range(50))
+def test_kernel_matches_numpy_fallback(seed):
+    rng = np.random.default_rng(seed)
+    n_queues = int(rng.integers(1, 12))
+    n_hours = int(rng.integers(1, 72))
+    state = _random_state(rng, n_queues)
+
+    peak_factors = _SEASONAL_FACTORS[(np.arange(n_hours) + int(rng.integers(0, 24))) % 24]
+    noise = rng.normal(1.0, 0.15, size=n_hours)
+
+    sim = _SimState.from_state(state)
+    kernel = _empty_outputs(n_hours, n_queues)
+    run_kernel(
+        sim.wip, sim.emp, sim.cap, sim.apt, sim.cplx,
+        peak_factors, noise, _FLOW_RATE, float(sim.sla), sim.incoming_rate,
+        *(kernel[name] for name in _HOURLY_OUTPUTS), kernel["total_risk"]
+    )
+
+    fallback = _empty_outputs(n_hours, n_queues)
+    ProcessSimulationEngine()._run_hourly(_SimState.from_state(state), peak_factors, noise, fallback)
+
+    for name in (*_HOURLY_OUTPUTS, "total_risk"):
+        assert np.allclose(kernel[name], fallback[name]), name
+
+def test_forecast_records_keep_large_wip_exact():
+    # 50 identical queues over a week: downstream WIP compounds far past int64
+    state = OperationalState(
+        workQueues=[
+            WorkQueue(
+                id=f"q{i}",
+                name=f"Queue {i}",
+                workInProgress=50,
+                capacity=60,
+                avgProcessTime=20,
+                employees=5,
+                complexity=1.5
+            )
+            for i in range(50)
+        ],
+        incomingRate=100,
+        timestamp=datetime(2025, 1, 1),
+        slaThreshold=60
+    )
+    ids, arrays, timestamps = ProcessSimulationEngine().run_simulation(state, 168, [])
+    records = _forecast_records(ids, arrays, timestamps)
+
+    assert arrays["new_wip"].max() > np.iinfo(np.int64).max
+    for record, wip_row in zip(records, arrays["new_wip"]):
+        wips = [prediction["workInProgress"] for prediction in record["predictions"].values()]
+        assert all(isinstance(wip, int) and wip >= 0 for wip in wips)
+        assert wips == [int(v) for v in wip_row]